@@ -1,8 +1,10 @@
 """
-Application entry point for Back-Office Player (Qt version).
+Application entry point for Back-Office Player.
 
-This module initializes the main components (audio player, segment manager,
-Qt main window) and starts the Qt event loop.
+This module selects the UI backend, initializes the main components
+(audio player, segment manager, main window) and starts the event loop.
+The chosen toolkit is imported lazily so that only one toolkit is ever
+loaded per run.
 
 :author: Amine Khettat
 :organization: BLIND SYSTEMS
@@ -14,19 +16,13 @@ Qt main window) and starts the Qt event loop.
 
 from __future__ import annotations
 
+import argparse
 import sys
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
 
-from core.audio_player import AudioPlayer
-from core.segment_manager import SegmentManager
-from ui.main_window import MainWindowQt
-
-
-def main() -> None:
+def _run_qt() -> int:
     """
-    Main function of the application.
+    Build and run the Qt (PySide6) user interface.
 
     Steps
     -----
@@ -36,7 +32,21 @@ def main() -> None:
     - Create an empty :class:`SegmentManager` (no audio file yet).
     - Instantiate the :class:`MainWindowQt` with these objects.
     - Start the Qt main loop.
+
+    Returns
+    -------
+    int
+        Exit code of the Qt event loop.
     """
+    # Imported here so that the toolkit is only loaded when this
+    # backend is actually selected.
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QIcon
+
+    from core.audio_player import AudioPlayer
+    from core.segment_manager import SegmentManager
+    from ui.main_window import MainWindowQt
+
     # Create the Qt application object.
     app = QApplication(sys.argv)
 
@@ -55,7 +65,33 @@ def main() -> None:
     window.show()
 
     # Start the Qt event loop.
-    sys.exit(app.exec())
+    return app.exec()
+
+
+# UI backends selectable from the command line. Only Qt ships today;
+# the table keeps the door open for others without importing any
+# toolkit at module level.
+_BACKENDS = {
+    "qt": _run_qt,
+}
+
+
+def main() -> None:
+    """
+    Main function of the application.
+
+    Parses the command line, picks the UI backend and runs it.
+    """
+    parser = argparse.ArgumentParser(description="Back-Office Player (BOP)")
+    parser.add_argument(
+        "--ui",
+        choices=sorted(_BACKENDS),
+        default="qt",
+        help="user interface backend to start (default: qt)",
+    )
+    args = parser.parse_args()
+
+    sys.exit(_BACKENDS[args.ui]())
 
 
 if __name__ == "__main__":
@@ -5,9 +5,9 @@ This module defines the :class:`AudioPlayer` class, which wraps VLC
 (via the ``python-vlc`` package) to play audio files, manage position,
 duration, and volume.
 
-The goal is to provide a simple API, independent from the UI layer,
-so that the Tkinter interface can control audio playback without
-knowing VLC internals.
+The goal is to provide a simple API, independent from the widget
+layer, so that the user interface can control audio playback without
+knowing VLC internals. State updates are published as Qt signals.
 
 :author: Amine Khettat
 :organization: BLIND SYSTEMS
@@ -19,18 +19,74 @@ knowing VLC internals.
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import Optional, Tuple
 
-import vlc  # Python bindings for the VLC media player
+from PySide6.QtCore import QObject, Signal
 
+# The python-vlc bindings are imported lazily (see _vlc below) because
+# loading libvlccore and its plugin cache costs several hundred
+# milliseconds, which would otherwise be paid at import time, before
+# the main window even appears.
+_vlc_module: Optional[ModuleType] = None
 
-class AudioPlayer:
+
+def _vlc() -> ModuleType:
+    """
+    Import the ``vlc`` module on first use and cache it.
+
+    Returns
+    -------
+    module
+        The imported ``vlc`` module (python-vlc bindings).
+    """
+    global _vlc_module
+    if _vlc_module is None:
+        import vlc  # Python bindings for the VLC media player
+
+        _vlc_module = vlc
+    return _vlc_module
+
+
+# Shared VLC instance: creating vlc.Instance() re-scans the plugin
+# directory (several hundred ms), so all AudioPlayer objects in the
+# process reuse a single instance.
+_shared_instance = None
+
+
+def _get_instance():
+    """
+    Return the process-wide :class:`vlc.Instance`, creating it on first use.
+
+    Returns
+    -------
+    vlc.Instance
+        Shared VLC instance.
+    """
+    global _shared_instance
+    if _shared_instance is None:
+        _shared_instance = _vlc().Instance()
+    return _shared_instance
+
+
+class AudioPlayer(QObject):
     """
     Audio player class using VLC.
 
-    This class does not depend on Tkinter and can be tested separately
-    from the UI.
+    The player pushes its state to consumers through Qt signals
+    (emitted from the VLC event callbacks), so the UI never needs to
+    poll it. It depends on QtCore only, not on any widget, and can be
+    driven headless.
+
+    Signals
+    -------
+    positionChanged : Signal(float)
+        Emitted with the new playback position in seconds.
+    durationChanged : Signal(float)
+        Emitted with the new media duration in seconds.
 
     Attributes
     ----------
@@ -44,6 +100,9 @@ class AudioPlayer:
         Path to the currently loaded audio file, or ``None``.
     """
 
+    positionChanged = Signal(float)
+    durationChanged = Signal(float)
+
     def __init__(self) -> None:
         """
         Initialize the audio player.
@@ -51,8 +110,11 @@ class AudioPlayer:
         - Create a VLC instance.
         - Create a media player without media.
         """
-        # Create VLC instance. Options could be passed here if needed.
-        self._instance = vlc.Instance()
+        super().__init__()
+
+        # Reuse the shared VLC instance (plugin scan happens only once
+        # per process, whatever the number of players).
+        self._instance = _get_instance()
 
         # Create media player associated with this instance.
         self._player = self._instance.media_player_new()
@@ -63,6 +125,27 @@ class AudioPlayer:
         # Path to the current audio file (for information only).
         self.current_file_path: Optional[Path] = None
 
+        # stat result of the current audio file (taken once at load
+        # time; callers needing mtime/size can reuse it via
+        # get_file_stat instead of re-statting).
+        self._stat: Optional[os.stat_result] = None
+
+        # Cached media duration in milliseconds (0 if unknown).
+        # Avoids a VLC round-trip on every position query.
+        self._cached_duration_ms: int = 0
+
+        # Current playback position in milliseconds, fed by the
+        # MediaPlayerTimeChanged event below.
+        self._position_ms: int = 0
+
+        # Subscribe to player events once: VLC pushes time/length
+        # updates into plain attributes, so the getters polled by the
+        # UI tick loop never cross the ctypes boundary.
+        vlc = _vlc()
+        em = self._player.event_manager()
+        em.event_attach(vlc.EventType.MediaPlayerTimeChanged, self._on_time_changed)
+        em.event_attach(vlc.EventType.MediaPlayerLengthChanged, self._on_length_changed)
+
     # ------------------------------------------------------------------ #
     # File management
     # ------------------------------------------------------------------ #
@@ -80,10 +163,18 @@ class AudioPlayer:
         FileNotFoundError
             If the file does not exist.
         """
-        file_path = Path(path)
+        # Avoid re-wrapping: Path() re-parses the string even when the
+        # argument is already a Path (the common case from the UI).
+        file_path = path if isinstance(path, Path) else Path(path)
+
+        # A single stat covers both the existence check and the
+        # freshness metadata (mtime/size) kept for later reuse.
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            raise FileNotFoundError(f"Audio file not found: {file_path}")
 
-        # Check that the file exists.
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise FileNotFoundError(f"Audio file not found: {file_path}")
 
         # Stop any current playback before loading a new media.
@@ -91,13 +182,90 @@ class AudioPlayer:
 
         # Update the current path.
         self.current_file_path = file_path
+        self._stat = st
 
         # Create VLC media from the file.
         self._media = self._instance.media_new(str(file_path))
 
+        # Ask VLC to parse the media (local file, no network) so that
+        # metadata such as the duration becomes available without
+        # having to start playback. Parsing is asynchronous: subscribe
+        # first, so the completion event publishes the duration even
+        # when a consumer queried too early and saw 0.
+        vlc = _vlc()
+        self._media.event_manager().event_attach(
+            vlc.EventType.MediaParsedChanged, self._on_parsed_changed
+        )
+        self._media.parse_with_options(vlc.MediaParseFlag.local, -1)
+
         # Attach the media to the player.
         self._player.set_media(self._media)
 
+        # The cached duration/position of the previous media are no
+        # longer valid.
+        self._cached_duration_ms = 0
+        self._position_ms = 0
+
+    # ------------------------------------------------------------------ #
+    # VLC event callbacks (called from a VLC thread; the Qt signals
+    # are delivered to UI-thread receivers through queued connections)
+    # ------------------------------------------------------------------ #
+    def _on_time_changed(self, event) -> None:
+        """
+        Record and publish the new playback time pushed by VLC.
+
+        Parameters
+        ----------
+        event : vlc.Event
+            Event carrying the new time in ``event.u.new_time`` (ms).
+        """
+        time_ms = event.u.new_time
+        self._position_ms = time_ms
+        self.positionChanged.emit(time_ms / 1000.0)
+
+    def _on_length_changed(self, event) -> None:
+        """
+        Record and publish the new media length pushed by VLC.
+
+        Parameters
+        ----------
+        event : vlc.Event
+            Event carrying the new length in ``event.u.new_length`` (ms).
+        """
+        length_ms = event.u.new_length
+        self._cached_duration_ms = length_ms
+        self.durationChanged.emit(length_ms / 1000.0)
+
+    def _on_parsed_changed(self, event) -> None:
+        """
+        Publish the duration once VLC has finished parsing the media.
+
+        Parameters
+        ----------
+        event : vlc.Event
+            Parse status event; the duration is read from the media.
+        """
+        media = self._media
+        if media is None:
+            return
+
+        length_ms = media.get_duration()
+        if length_ms > 0:
+            self._cached_duration_ms = length_ms
+            self.durationChanged.emit(length_ms / 1000.0)
+
+    def get_file_stat(self) -> Optional[os.stat_result]:
+        """
+        Return the stat result of the currently loaded file.
+
+        Returns
+        -------
+        os.stat_result or None
+            Result of the ``os.stat`` call made in :meth:`load_file`,
+            or ``None`` if no file is loaded.
+        """
+        return self._stat
+
     # ------------------------------------------------------------------ #
     # Playback controls
     # ------------------------------------------------------------------ #
@@ -134,6 +302,26 @@ class AudioPlayer:
 
         self._player.stop()
 
+        # Stopping rewinds to the beginning; VLC does not emit a
+        # TimeChanged event for it, so reset and publish ourselves.
+        self._position_ms = 0
+        self.positionChanged.emit(0.0)
+
+    def is_playing(self) -> bool:
+        """
+        Tell whether playback is currently running.
+
+        Returns
+        -------
+        bool
+            ``True`` if the player is playing, ``False`` otherwise
+            (paused, stopped, or no media loaded).
+        """
+        if self._media is None:
+            return False
+
+        return bool(self._player.is_playing())
+
     # ------------------------------------------------------------------ #
     # Position and duration
     # ------------------------------------------------------------------ #
@@ -167,6 +355,11 @@ class AudioPlayer:
 
         self._player.set_position(ratio)
 
+        # Reflect the seek immediately; the next TimeChanged event will
+        # correct any rounding.
+        self._position_ms = int(ratio * duration * 1000.0)
+        self.positionChanged.emit(self._position_ms / 1000.0)
+
     def get_position(self) -> float:
         """
         Return the current playback position in seconds.
@@ -174,23 +367,18 @@ class AudioPlayer:
         Returns
         -------
         float
-            Current playback position in seconds, or ``0.0`` if the
-            duration is unknown or no media is loaded.
+            Current playback position in seconds, or ``0.0`` if no
+            media is loaded.
+
+        Notes
+        -----
+        The position is maintained by the ``MediaPlayerTimeChanged``
+        event, so this is a plain attribute read — no VLC call.
         """
         if self._media is None:
             return 0.0
 
-        duration = self.get_duration()
-        if duration <= 0:
-            return 0.0
-
-        # Normalized position (between 0 and 1).
-        pos = self._player.get_position()
-        if pos < 0:
-            # VLC may return -1.0 if the position is not known.
-            pos = 0.0
-
-        return duration * pos
+        return self._position_ms / 1000.0
 
     def get_duration(self) -> float:
         """
@@ -204,28 +392,49 @@ class AudioPlayer:
 
         Notes
         -----
-        VLC only knows the duration after playback has started.
-        This method may trigger a quick play/stop to force VLC
-        to determine the duration.
+        The media is parsed in :meth:`load_file`, so the duration is
+        normally available without starting playback; once playback
+        runs, the ``MediaPlayerLengthChanged`` event keeps the cache
+        up to date. Repeated calls (e.g. from the UI refresh timer) do
+        not hit VLC.
         """
         if self._media is None:
             return 0.0
 
-        # Duration in milliseconds.
-        length_ms = self._player.get_length()
-
-        # If duration is unknown, trigger a quick play/stop.
-        if length_ms <= 0:
-            self._player.play()
-            self._player.stop()
-            length_ms = self._player.get_length()
+        # Fast path: duration known from parsing or from the
+        # LengthChanged event.
+        if self._cached_duration_ms > 0:
+            return self._cached_duration_ms / 1000.0
 
+        # The parsed media knows its duration before playback starts.
+        length_ms = self._media.get_duration()
         if length_ms <= 0:
             return 0.0
 
+        # Cache the result for subsequent calls.
+        self._cached_duration_ms = length_ms
+
         # Convert milliseconds to seconds.
         return length_ms / 1000.0
 
+    def get_pos_and_duration(self) -> Tuple[float, float]:
+        """
+        Return the playback position and the media duration together.
+
+        Fused getter for the UI tick loop: one method call per tick
+        instead of two.
+
+        Returns
+        -------
+        tuple of float
+            ``(position_sec, duration_sec)``, both ``0.0`` when no
+            media is loaded.
+        """
+        if self._media is None:
+            return (0.0, 0.0)
+
+        return (self._position_ms / 1000.0, self.get_duration())
+
     # ------------------------------------------------------------------ #
     # Volume
     # ------------------------------------------------------------------ #
@@ -19,15 +19,20 @@ A segment is defined by:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Segment:
     """
     Represents an A–B segment in an audio file.
 
+    Instances are immutable (``frozen=True``) and hold no per-instance
+    ``__dict__`` (``slots=True``), which keeps large collections of
+    segments compact and makes segments hashable. Use
+    :func:`dataclasses.replace` to derive a modified copy.
+
     Attributes
     ----------
     name : str
@@ -63,7 +68,14 @@ class Segment:
         dict
             Dictionary containing all segment fields.
         """
-        return asdict(self)
+        # Build the dict by hand: dataclasses.asdict walks the fields
+        # reflectively (and deep-copies values), which is needlessly
+        # expensive for three scalars on the save path.
+        return {
+            "name": self.name,
+            "start_sec": self.start_sec,
+            "end_sec": self.end_sec,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Segment":
@@ -21,6 +21,8 @@ opyright: (c) 2025 BLIND SYSTEMS
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 from .segment import Segment
@@ -38,8 +40,15 @@ class SegmentManager:
         """
         Initialize an empty :class:`SegmentManager`.
         """
-        # Internal list of segments.
-        self._segments: List[Segment] = []
+        # Segments keyed by name, in insertion order. A single ordered
+        # mapping gives O(1) lookup/replace/remove while keeping the
+        # display order, with no parallel list to maintain.
+        self._segments: OrderedDict[str, Segment] = OrderedDict()
+
+        # Path of the JSON metadata file this collection belongs to.
+        # Filled by :func:`infra.persistence.load_segments` so that
+        # later saves can reuse the computed path.
+        self.meta_path: Optional[Path] = None
 
     # ------------------------------------------------------------------ #
     # Segment operations
@@ -48,34 +57,30 @@ class SegmentManager:
         """
         Add a segment to the collection.
 
-        If a segment with the same name already exists, it is replaced.
+        If a segment with the same name already exists, it is replaced
+        in place (the segment keeps its position in the collection).
 
         Parameters
         ----------
         segment : Segment
             Segment to add.
         """
-        existing = self.get_segment(segment.name)
-        if existing is not None:
-            # Remove the old one before adding the new one.
-            self.remove_segment(segment.name)
-
-        self._segments.append(segment)
+        self._segments[segment.name] = segment
 
     def remove_segment(self, name: str) -> None:
         """
-        Remove all segments with a given name.
+        Remove the segment with a given name.
 
         Parameters
         ----------
         name : str
-            Name of the segment(s) to remove.
+            Name of the segment to remove.
         """
-        self._segments = [s for s in self._segments if s.name != name]
+        self._segments.pop(name, None)
 
     def get_segment(self, name: str) -> Optional[Segment]:
         """
-        Return the first segment with a given name.
+        Return the segment with a given name.
 
         Parameters
         ----------
@@ -87,10 +92,7 @@ class SegmentManager:
         Segment or None
             Matching segment, or ``None`` if not found.
         """
-        for s in self._segments:
-            if s.name == name:
-                return s
-        return None
+        return self._segments.get(name)
 
     def list_segments(self) -> List[Segment]:
         """
@@ -99,9 +101,40 @@ class SegmentManager:
         Returns
         -------
         list[Segment]
-            Copy of the internal segments list.
+            Segments in insertion order.
+        """
+        return list(self._segments.values())
+
+    def durations_array(self):
+        """
+        Return the durations of all segments as a NumPy array.
+
+        Intended for aggregate statistics over large collections
+        (total practice time, longest segment, etc.): the computation
+        runs vectorized instead of looping over Python objects.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``float64`` durations in seconds, clamped to ``0.0``, in
+            insertion order.
         """
-        return list(self._segments)
+        # Imported on first use: this is the only place the core
+        # package needs NumPy.
+        import numpy as np
+
+        count = len(self._segments)
+        starts = np.fromiter(
+            (s.start_sec for s in self._segments.values()),
+            dtype=np.float64,
+            count=count,
+        )
+        ends = np.fromiter(
+            (s.end_sec for s in self._segments.values()),
+            dtype=np.float64,
+            count=count,
+        )
+        return np.maximum(ends - starts, 0.0)
 
     # ------------------------------------------------------------------ #
     # Serialization
@@ -116,7 +149,7 @@ class SegmentManager:
             Dictionary containing the list of serialized segments.
         """
         return {
-            "segments": [s.to_dict() for s in self._segments],
+            "segments": [s.to_dict() for s in self._segments.values()],
         }
 
     @classmethod
@@ -17,12 +17,81 @@ the original audio file name.
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
+try:
+    # Optional C-accelerated JSON codec (much faster on large files).
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    # Optional incremental JSON parser, used to stream very large
+    # segment files instead of materializing them in memory at once.
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+from core.segment import Segment
 from core.segment_manager import SegmentManager
 
+# Segment files at least this big are stream-decoded with ijson (when
+# installed); smaller files load faster through a plain read + parse.
+_STREAMING_THRESHOLD = 1 << 20  # 1 MiB
+
+logger = logging.getLogger(__name__)
+
+# Digest of the payload last written per metadata file, used to skip
+# rewrites that would not change the file.
+_last_saved: Dict[str, bytes] = {}
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize a dictionary to JSON bytes.
+
+    Uses :mod:`orjson` when available, falling back to the stdlib
+    :mod:`json` module otherwise. Output is indented for readability.
+
+    Parameters
+    ----------
+    data : dict
+        Dictionary to serialize.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse JSON bytes into a dictionary.
+
+    Parameters
+    ----------
+    raw : bytes
+        UTF-8 encoded JSON document.
+
+    Returns
+    -------
+    dict
+        Parsed dictionary.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def get_metadata_path(audio_file_path: Optional[Path]) -> Optional[Path]:
     """
@@ -46,12 +115,62 @@ def get_metadata_path(audio_file_path: Optional[Path]) -> Optional[Path]:
     if audio_file_path is None:
         return None
 
-    audio_path = Path(audio_file_path)
+    # Callers normally pass a Path already; only wrap when needed.
+    audio_path = (
+        audio_file_path
+        if isinstance(audio_file_path, Path)
+        else Path(audio_file_path)
+    )
 
     # Example: "myfile.mp3" -> "myfile.mp3.segments.json"
     return audio_path.with_suffix(audio_path.suffix + ".segments.json")
 
 
+@functools.lru_cache(maxsize=128)
+def _load_cached(meta_path_str: str, mtime_ns: int, size: int) -> SegmentManager:
+    """
+    Parse a segment file, memoized on path + modification time + size.
+
+    Parameters
+    ----------
+    meta_path_str : str
+        Path to the JSON segment file.
+    mtime_ns : int
+        Modification time of the file in nanoseconds.
+    size : int
+        Size of the file in bytes.
+
+    Returns
+    -------
+    SegmentManager
+        Manager parsed from the file.
+
+    Notes
+    -----
+    ``mtime_ns`` and ``size`` are only there as freshness keys: if the
+    file changes on disk, the key changes and the stale entry is simply
+    no longer hit. ``size`` additionally decides whether the file is
+    worth stream-decoding.
+    """
+    if ijson is not None and size >= _STREAMING_THRESHOLD:
+        # Stream the segments one by one: peak memory stays at a single
+        # segment dict instead of the whole document.
+        manager = SegmentManager()
+        with open(meta_path_str, "rb") as f:
+            for obj in ijson.items(f, "segments.item"):
+                manager.add_segment(
+                    Segment(
+                        name=obj["name"],
+                        start_sec=float(obj["start_sec"]),
+                        end_sec=float(obj["end_sec"]),
+                    )
+                )
+        return manager
+
+    with open(meta_path_str, "rb") as f:
+        return SegmentManager.from_dict(_loads(f.read()))
+
+
 def load_segments(audio_file_path: Optional[Path]) -> SegmentManager:
     """
     Load segments associated with an audio file.
@@ -66,6 +185,13 @@ def load_segments(audio_file_path: Optional[Path]) -> SegmentManager:
     SegmentManager
         Segment manager instance. If no JSON file is found, or in case
         of any error, an empty manager is returned.
+
+    Notes
+    -----
+    Results are cached in memory keyed by the metadata file's path,
+    modification time and size, so reopening a recently used file skips
+    the disk read and JSON parse entirely. A cache hit returns the same
+    :class:`SegmentManager` object as the previous load.
     """
     manager = SegmentManager()
 
@@ -74,17 +200,22 @@ def load_segments(audio_file_path: Optional[Path]) -> SegmentManager:
         # No audio file => no associated segments.
         return manager
 
-    if not meta_path.is_file():
+    # Remember where this collection lives so saves can reuse the path.
+    manager.meta_path = meta_path
+
+    try:
+        st = meta_path.stat()
+    except OSError:
         # No JSON file found => return empty manager.
         return manager
 
     try:
-        with meta_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return SegmentManager.from_dict(data)
+        loaded = _load_cached(str(meta_path), st.st_mtime_ns, st.st_size)
+        loaded.meta_path = meta_path
+        return loaded
     except Exception:
         # On any error (file corruption, invalid JSON, etc.), return empty manager.
-        return SegmentManager()
+        return manager
 
 
 def save_segments(audio_file_path: Optional[Path], manager: SegmentManager) -> None:
@@ -99,14 +230,108 @@ def save_segments(audio_file_path: Optional[Path], manager: SegmentManager) -> N
     manager : SegmentManager
         Segment manager to save.
     """
-    meta_path = get_metadata_path(audio_file_path)
+    # Prefer the path computed at load time; fall back to deriving it
+    # from the audio file for managers built another way.
+    meta_path = manager.meta_path
+    if meta_path is None:
+        meta_path = get_metadata_path(audio_file_path)
     if meta_path is None:
         # No audio file => cannot associate a metadata file.
         return
 
+    # Serialize once; if the payload is byte-identical to what was last
+    # written for this file, the write (and its fsync) can be skipped.
+    payload = _dumps(manager.to_dict())
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if _last_saved.get(str(meta_path)) == digest:
+        return
+
+    # Write to a temporary file first, then atomically replace the
+    # destination: a crash mid-write can no longer leave a truncated
+    # JSON file behind (which load_segments would silently turn into
+    # an empty manager).
+    tmp_path = meta_path.with_name(meta_path.name + ".tmp")
     try:
-        with meta_path.open("w", encoding="utf-8") as f:
-            json.dump(manager.to_dict(), f, ensure_ascii=False, indent=2)
-    except Exception as exc:
-        # In a real application, you would use logging instead of print.
-        print(f"Error while saving segments: {exc}")
+        with tmp_path.open("wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, meta_path)
+        _last_saved[str(meta_path)] = digest
+        # Drop cached parses: the file on disk just changed.
+        _load_cached.cache_clear()
+    except Exception:
+        # Clean up the temporary file; the previous save (if any) is intact.
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        logger.exception("Error while saving segments to %s", meta_path)
+
+
+class SegmentAutoSaver:
+    """
+    Debounced saver that coalesces bursts of segment-save requests.
+
+    Edit callbacks may call :meth:`request_save` as often as they like
+    (e.g. once per tick while the user drags a segment endpoint); the
+    actual disk write only happens once the requests have been quiet
+    for the debounce interval, so a burst of edits costs one write.
+    """
+
+    def __init__(self, interval_ms: int = 300) -> None:
+        """
+        Initialize the auto saver.
+
+        Parameters
+        ----------
+        interval_ms : int, optional
+            Quiet period (milliseconds) before a pending save is
+            written to disk. Default is 300 ms.
+        """
+        # Imported here so that the plain load/save helpers in this
+        # module remain usable from scripts without Qt installed.
+        from PySide6.QtCore import QTimer
+
+        # Latest requested save, or None when nothing is pending.
+        self._pending: Optional[Tuple[Optional[Path], SegmentManager]] = None
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._flush)
+
+    def request_save(
+        self, audio_file_path: Optional[Path], manager: SegmentManager
+    ) -> None:
+        """
+        Schedule a save of the given manager, replacing any pending one.
+
+        Parameters
+        ----------
+        audio_file_path : Path or None
+            Path to the audio file whose segments are to be saved.
+        manager : SegmentManager
+            Segment manager to save.
+        """
+        self._pending = (audio_file_path, manager)
+        # Restarting the timer pushes the write back until the burst ends.
+        self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Write any pending save immediately (e.g. on window close).
+        """
+        self._timer.stop()
+        self._flush()
+
+    def _flush(self) -> None:
+        """
+        Perform the pending save, if any.
+        """
+        if self._pending is None:
+            return
+
+        audio_file_path, manager = self._pending
+        self._pending = None
+        save_segments(audio_file_path, manager)
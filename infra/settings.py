@@ -17,9 +17,26 @@ simple user preferences, such as:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import os
+import queue
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    # Optional C-accelerated JSON codec (same fallback as infra.persistence).
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Digest of the last settings payload written, to avoid rewriting an
+# identical file.
+_last_saved_digest: bytes = b""
 
 # Default application settings.
 DEFAULT_SETTINGS: Dict[str, Any] = {
@@ -60,8 +77,9 @@ def load_settings() -> Dict[str, Any]:
         return DEFAULT_SETTINGS.copy()
 
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        with path.open("rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
         # Start from defaults and update with file content.
         settings = DEFAULT_SETTINGS.copy()
@@ -81,10 +99,128 @@ def save_settings(settings: Dict[str, Any]) -> None:
     settings : dict
         Settings dictionary to save.
     """
+    global _last_saved_digest
+
     path = get_settings_path()
+
+    # Compact output: pretty-printing buys nothing for a tiny machine-
+    # managed file, and a single pre-built payload means one buffered
+    # write instead of many small ones.
+    if orjson is not None:
+        payload = orjson.dumps(settings)
+    else:
+        payload = json.dumps(
+            settings, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    # Nothing changed since the last successful save => no disk I/O.
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    if digest == _last_saved_digest:
+        return
+
+    # Durable-write pattern: dump to a sibling temp file, fsync, then
+    # rename over the destination so the settings file is never left
+    # half-written.
+    tmp_path = path.with_name(path.name + ".tmp")
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
-    except Exception as exc:
-        # In a real application, prefer logging instead of print.
-        print(f"Error while saving settings: {exc}")
+        with tmp_path.open("wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        _last_saved_digest = digest
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        logger.exception("Error while saving settings to %s", path)
+
+
+# ---------------------------------------------------------------------- #
+# Asynchronous saving
+# ---------------------------------------------------------------------- #
+# Single-slot queue feeding a background writer thread: the GUI thread
+# hands over a snapshot and returns immediately, and a pending snapshot
+# is simply replaced by a newer one (the last state always wins).
+_save_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=1)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _writer_loop() -> None:
+    """
+    Consume queued settings snapshots and write them to disk.
+    """
+    while True:
+        settings = _save_queue.get()
+        try:
+            save_settings(settings)
+        finally:
+            _save_queue.task_done()
+
+
+def _ensure_writer() -> None:
+    """
+    Start the background writer thread on first use.
+    """
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="settings-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def save_settings_async(settings: Dict[str, Any]) -> None:
+    """
+    Queue a settings save for the background writer thread.
+
+    Parameters
+    ----------
+    settings : dict
+        Settings dictionary to save. A snapshot is taken, so the
+        caller may keep mutating its dictionary afterwards.
+
+    Notes
+    -----
+    If a save is already pending, it is replaced by this one instead
+    of being queued behind it: only the newest state reaches the disk.
+    """
+    _ensure_writer()
+
+    snapshot = dict(settings)
+    while True:
+        try:
+            _save_queue.put_nowait(snapshot)
+            return
+        except queue.Full:
+            # Drop the stale pending snapshot and retry with ours.
+            try:
+                _save_queue.get_nowait()
+                _save_queue.task_done()
+            except queue.Empty:
+                pass
+
+
+def flush_pending_saves(timeout: float = 2.0) -> None:
+    """
+    Wait until queued settings saves have been written.
+
+    Intended for application shutdown, so the last queued snapshot is
+    not lost when the daemon writer thread dies with the process.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Maximum time to wait, in seconds. Default is 2 seconds.
+    """
+    if _writer_thread is None:
+        return
+
+    # Queue.join has no timeout of its own; wait for it from a helper
+    # thread so shutdown cannot hang on a stuck write.
+    waiter = threading.Thread(target=_save_queue.join, daemon=True)
+    waiter.start()
+    waiter.join(timeout)
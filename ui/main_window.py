@@ -22,16 +22,16 @@ Responsibilities
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import QObject, QThread, QTimer, Qt, Signal
 from PySide6.QtGui import QKeySequence, QShortcut, QIcon
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
-    QVBoxLayout,
-    QHBoxLayout,
+    QGridLayout,
     QPushButton,
     QLabel,
     QSlider,
@@ -42,8 +42,157 @@ from PySide6.QtWidgets import (
 
 from core.audio_player import AudioPlayer
 from core.segment_manager import SegmentManager
-from infra.settings import load_settings, save_settings
-from infra.persistence import load_segments
+from infra.settings import flush_pending_saves, load_settings, save_settings_async
+from infra.persistence import SegmentAutoSaver, load_segments
+
+
+# Keyboard shortcuts as (key sequence, handler attribute name) pairs.
+# There is intentionally no global shortcut on the space bar, so that
+# Space/Enter keep activating the focused button (standard behavior).
+_SHORTCUTS = (
+    ("Ctrl+O", "on_open_file"),
+    ("Ctrl+P", "on_play"),
+    ("Ctrl+Shift+P", "on_pause"),
+    ("Ctrl+S", "on_stop"),
+    ("Ctrl+Shift+A", "on_set_point_a"),
+    ("Ctrl+Shift+B", "on_set_point_b"),
+)
+
+# QKeySequence parses its textual form; cache the parsed objects so
+# the cost is paid once per process, not once per window.
+_key_sequences: Dict[str, QKeySequence] = {}
+
+
+# Application icon, decoded from the .ico once per process and shared
+# by every window that needs it.
+_app_icon: Optional[QIcon] = None
+
+
+def _get_app_icon() -> QIcon:
+    """
+    Return the shared application icon, loading it on first use.
+
+    Returns
+    -------
+    QIcon
+        Icon decoded from ``resources/BOP.ico``.
+    """
+    global _app_icon
+    if _app_icon is None:
+        _app_icon = QIcon("resources/BOP.ico")
+    return _app_icon
+
+
+class FileLoadWorker(QObject):
+    """
+    Worker that loads an audio file and its segments off the UI thread.
+
+    Lives on a dedicated :class:`QThread` owned by the main window;
+    loading (VLC media creation + parse, segment JSON decode) runs
+    there, and the outcome comes back through signals so the event
+    loop never stalls on a large file.
+
+    Signals
+    -------
+    finished : Signal(object, object)
+        Emitted with ``(path, segment_manager)`` on success.
+    failed : Signal(object, str)
+        Emitted with ``(path, error_message)`` on failure.
+    """
+
+    finished = Signal(object, object)
+    failed = Signal(object, str)
+
+    def __init__(self, audio_player: AudioPlayer) -> None:
+        """
+        Initialize the worker.
+
+        Parameters
+        ----------
+        audio_player : AudioPlayer
+            Player the files are loaded into.
+        """
+        super().__init__()
+        self._audio_player = audio_player
+
+    def load(self, path: Path) -> None:
+        """
+        Load an audio file and its segments, reporting via signals.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the audio file to load.
+        """
+        try:
+            self._audio_player.load_file(path)
+            segments = load_segments(path)
+        except Exception as exc:
+            self.failed.emit(path, str(exc))
+            return
+
+        self.finished.emit(path, segments)
+
+
+class SeekSlider(QSlider):
+    """
+    Slider that also reports keyboard seeks through ``sliderMoved``.
+
+    ``sliderMoved`` normally only fires while dragging with the mouse.
+    This subclass re-emits it after a key press that moved the handle,
+    so seeking can be wired to user gestures only — programmatic
+    ``setValue`` calls (the periodic position updates) then trigger no
+    seek at all, without any signal blocking.
+    """
+
+    # Keys that move the handle and must therefore trigger a seek.
+    _SEEK_KEYS = (
+        Qt.Key_Left,
+        Qt.Key_Right,
+        Qt.Key_Up,
+        Qt.Key_Down,
+        Qt.Key_PageUp,
+        Qt.Key_PageDown,
+        Qt.Key_Home,
+        Qt.Key_End,
+    )
+
+    def keyPressEvent(self, event) -> None:
+        """
+        Forward the key press and re-emit ``sliderMoved`` if it seeked.
+
+        Parameters
+        ----------
+        event : QKeyEvent
+            Key event forwarded by Qt.
+        """
+        super().keyPressEvent(event)
+        if event.key() in self._SEEK_KEYS:
+            self.sliderMoved.emit(self.value())
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_time_impl(total_seconds: int) -> str:
+    """
+    Format a whole number of seconds as ``mm:ss``.
+
+    Memoized: the tick handler renders the same integer second many
+    ticks in a row (and the duration on every tick), so most calls are
+    cache hits instead of f-string formatting. The domain is tiny
+    (one entry per distinct second displayed).
+
+    Parameters
+    ----------
+    total_seconds : int
+        Time in whole seconds (non-negative).
+
+    Returns
+    -------
+    str
+        Formatted string in ``mm:ss`` format.
+    """
+    minutes, secs = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
 
 
 class MainWindowQt(QMainWindow):
@@ -54,6 +203,13 @@ class MainWindowQt(QMainWindow):
     while reusing the existing core and infra modules.
     """
 
+    # File dialog filter, shared by every open.
+    _FILE_FILTER = "Audio files (*.mp3 *.wav *.wma *.flac *.ogg);;All files (*.*)"
+
+    # Internal signal carrying load requests to the worker thread
+    # (queued connection, since the worker lives on another thread).
+    _load_requested = Signal(object)
+
     def __init__(self, audio_player: AudioPlayer, segment_manager: SegmentManager) -> None:
         """
         Initialize the main Qt window.
@@ -72,18 +228,62 @@ class MainWindowQt(QMainWindow):
         self.segment_manager = segment_manager
         self.settings = load_settings()
 
+        # Debounced segment persistence: segment edits should go through
+        # request_save so that bursts of edits coalesce into one write.
+        self.segment_autosaver = SegmentAutoSaver()
+
         # Path to the currently loaded audio file (None if no file).
         self.current_audio_path: Optional[Path] = None
 
+        # Start directory for the file dialog, kept as a plain string:
+        # resolved once from settings (the Path.cwd fallback is a
+        # syscall) and updated on each successful load.
+        self._last_folder: str = (
+            self.settings.get("last_opened_folder") or str(Path.cwd())
+        )
+
         # A–B loop internal state.
         self.point_a: Optional[float] = None
         self.point_b: Optional[float] = None
         self.loop_enabled: bool = False
 
+        # Precomputed loop state, refreshed by _recompute_loop_active
+        # whenever A, B or the checkbox change: the position handler
+        # then tests a single boolean instead of the full conjunction.
+        self._loop_active: bool = False
+        self._loop_a: float = 0.0
+        self._loop_b: float = 0.0
+
+        # Last values pushed to the position widgets, to skip the
+        # setRange/setValue/setText calls (and their paint events) when
+        # nothing visible changed — the common case while paused.
+        self._last_pos_int: int = -1
+        self._last_duration_int: int = -1
+        self._last_time_text: str = ""
+
+        # Current media duration in seconds, as last published by the
+        # player (used to render the time label).
+        self._duration: float = 0.0
+
         # Build the user interface and timers.
         self._build_ui()
         self._configure_shortcuts()
-        self._configure_timer()
+        self._configure_timers()
+
+        # Event-driven display: the player pushes position/duration
+        # changes through its signals, so nothing polls it.
+        self.audio_player.positionChanged.connect(self._on_position_changed)
+        self.audio_player.durationChanged.connect(self._on_duration_changed)
+
+        # Persistent worker thread for file loading, so opening a large
+        # file never freezes the event loop.
+        self._load_thread = QThread(self)
+        self._load_worker = FileLoadWorker(audio_player)
+        self._load_worker.moveToThread(self._load_thread)
+        self._load_requested.connect(self._load_worker.load)
+        self._load_worker.finished.connect(self._on_load_finished)
+        self._load_worker.failed.connect(self._on_load_failed)
+        self._load_thread.start()
 
         # Apply initial volume from settings.
         initial_volume = int(self.settings.get("default_volume", 80))
@@ -99,6 +299,9 @@ class MainWindowQt(QMainWindow):
 
         Layout
         ------
+        A single :class:`QGridLayout` (one size-hint traversal per
+        resize, instead of one per stacked sub-layout):
+
         - Row 0: audio file selection.
         - Row 1: playback controls + volume.
         - Row 2: position slider + time display.
@@ -107,15 +310,13 @@ class MainWindowQt(QMainWindow):
         """
         # Window title and icon.
         self.setWindowTitle("Back-Office Player (BOP)")
-        self.setWindowIcon(QIcon("resources/BOP.ico"))
+        self.setWindowIcon(_get_app_icon())
 
         # Central widget and main layout.
         central = QWidget()
-        main_layout = QVBoxLayout(central)
+        grid = QGridLayout(central)
 
         # ---------------- Row 0: file selection ------------------------- #
-        file_layout = QHBoxLayout()
-
         self.btn_open = QPushButton("Open audio file...")
         self.btn_open.setAccessibleName("Open audio file")
         self.btn_open.setAccessibleDescription(
@@ -126,12 +327,10 @@ class MainWindowQt(QMainWindow):
         self.lbl_file = QLabel("No file.")
         self.lbl_file.setAccessibleName("Current file name")
 
-        file_layout.addWidget(self.btn_open)
-        file_layout.addWidget(self.lbl_file)
+        grid.addWidget(self.btn_open, 0, 0)
+        grid.addWidget(self.lbl_file, 0, 1, 1, 4)
 
         # ---------------- Row 1: playback controls + volume ------------- #
-        controls_layout = QHBoxLayout()
-
         self.btn_play = QPushButton("Play")
         self.btn_play.setAccessibleName("Play")
         self.btn_play.clicked.connect(self.on_play)
@@ -149,39 +348,52 @@ class MainWindowQt(QMainWindow):
 
         self.slider_volume = QSlider(Qt.Horizontal)
         self.slider_volume.setRange(0, 100)
+        # No tick marks: Qt's slider paint path is markedly slower with
+        # ticks enabled, and they add nothing here.
+        self.slider_volume.setTickPosition(QSlider.NoTicks)
+        self.slider_volume.setTickInterval(0)
         self.slider_volume.setAccessibleName("Volume slider")
-        self.slider_volume.valueChanged.connect(self.on_volume_change)
+        # valueChanged only adjusts the audio; the disk write happens
+        # on sliderReleased (or debounced, for keyboard changes).
+        self.slider_volume.valueChanged.connect(self._apply_volume)
+        self.slider_volume.sliderReleased.connect(self._persist_volume)
 
-        controls_layout.addWidget(self.btn_play)
-        controls_layout.addWidget(self.btn_pause)
-        controls_layout.addWidget(self.btn_stop)
-        controls_layout.addWidget(lbl_volume)
-        controls_layout.addWidget(self.slider_volume)
+        grid.addWidget(self.btn_play, 1, 0)
+        grid.addWidget(self.btn_pause, 1, 1)
+        grid.addWidget(self.btn_stop, 1, 2)
+        grid.addWidget(lbl_volume, 1, 3)
+        grid.addWidget(self.slider_volume, 1, 4)
 
         # ---------------- Row 2: position + time ------------------------ #
-        position_layout = QHBoxLayout()
-
         lbl_position = QLabel("Position (seconds):")
         lbl_position.setAccessibleName("Position label")
 
-        self.slider_position = QSlider(Qt.Horizontal)
+        self.slider_position = SeekSlider(Qt.Horizontal)
         self.slider_position.setRange(0, 0)  # Duration unknown at startup.
+        # No tick marks — this slider's range grows with the audio
+        # duration, so a long track would otherwise mean thousands of
+        # tick slots to paint on every repaint.
+        self.slider_position.setTickPosition(QSlider.NoTicks)
+        self.slider_position.setTickInterval(0)
         self.slider_position.setAccessibleName("Position slider")
         # Step of 1 second per arrow key.
         self.slider_position.setSingleStep(1)
-        # IMPORTANT: use valueChanged so that keyboard arrows also trigger seeking.
-        self.slider_position.valueChanged.connect(self.on_seek)
+        # sliderMoved only fires on user gestures (SeekSlider extends it
+        # to keyboard seeks), so the periodic setValue updates cannot
+        # feed back into on_seek.
+        self.slider_position.sliderMoved.connect(self.on_seek)
+        # Releasing the handle applies the pending seek immediately
+        # instead of waiting for the coalescing timer.
+        self.slider_position.sliderReleased.connect(self._flush_seek)
 
         self.lbl_time = QLabel("00:00 / 00:00")
         self.lbl_time.setAccessibleName("Time display")
 
-        position_layout.addWidget(lbl_position)
-        position_layout.addWidget(self.slider_position)
-        position_layout.addWidget(self.lbl_time)
+        grid.addWidget(lbl_position, 2, 0)
+        grid.addWidget(self.slider_position, 2, 1, 1, 3)
+        grid.addWidget(self.lbl_time, 2, 4)
 
         # ---------------- Row 3: A–B loop controls ---------------------- #
-        loop_layout = QHBoxLayout()
-
         self.btn_set_a = QPushButton("Set A")
         self.btn_set_a.setAccessibleName("Set point A")
         self.btn_set_a.setAccessibleDescription(
@@ -201,7 +413,9 @@ class MainWindowQt(QMainWindow):
         self.btn_clear_ab.setAccessibleDescription(
             "Clear loop points A and B and disable the A–B loop."
         )
-        self.btn_clear_ab.clicked.connect(self.on_clear_points)
+        # clicked(bool) would otherwise feed checked=False into the
+        # update_status parameter and mute the status message.
+        self.btn_clear_ab.clicked.connect(lambda: self.on_clear_points())
 
         self.chk_loop = QCheckBox("Loop A–B")
         self.chk_loop.setAccessibleName("Loop A-B checkbox")
@@ -210,21 +424,20 @@ class MainWindowQt(QMainWindow):
         )
         self.chk_loop.stateChanged.connect(self.on_loop_state_changed)
 
-        loop_layout.addWidget(self.btn_set_a)
-        loop_layout.addWidget(self.btn_set_b)
-        loop_layout.addWidget(self.btn_clear_ab)
-        loop_layout.addWidget(self.chk_loop)
+        grid.addWidget(self.btn_set_a, 3, 0)
+        grid.addWidget(self.btn_set_b, 3, 1)
+        grid.addWidget(self.btn_clear_ab, 3, 2)
+        grid.addWidget(self.chk_loop, 3, 3, 1, 2)
 
         # ---------------- Row 4: status label --------------------------- #
         self.lbl_status = QLabel("No file loaded.")
         self.lbl_status.setAccessibleName("Status message")
 
-        # Assemble main layout.
-        main_layout.addLayout(file_layout)
-        main_layout.addLayout(controls_layout)
-        main_layout.addLayout(position_layout)
-        main_layout.addLayout(loop_layout)
-        main_layout.addWidget(self.lbl_status)
+        grid.addWidget(self.lbl_status, 4, 0, 1, 5)
+
+        # Let the slider columns absorb the extra width on resize.
+        for col in range(1, 5):
+            grid.setColumnStretch(col, 1)
 
         self.setCentralWidget(central)
 
@@ -235,56 +448,48 @@ class MainWindowQt(QMainWindow):
         """
         Configure keyboard shortcuts for the application.
 
-        Shortcuts configured
-        --------------------
-        - Ctrl+O: open an audio file.
-        - Ctrl+P: play (or restart) playback.
-        - Ctrl+Shift+P: pause playback.
-        - Ctrl+S: stop playback.
-        - Ctrl+Shift+A: set point A at the current position.
-        - Ctrl+Shift+B: set point B at the current position.
-
-        Notes
-        -----
-        There is intentionally no global shortcut on the space bar, so that
-        Space/Enter keep activating the focused button (standard behavior).
+        The bindings are driven by the module-level ``_SHORTCUTS``
+        table (key sequence -> handler name); parsed key sequences are
+        shared across windows.
         """
-        # Ctrl+O -> Open audio file.
-        shortcut_open = QShortcut(QKeySequence("Ctrl+O"), self)
-        shortcut_open.activated.connect(self.on_open_file)
-
-        # Ctrl+P -> Play.
-        shortcut_play = QShortcut(QKeySequence("Ctrl+P"), self)
-        shortcut_play.activated.connect(self.on_play)
-
-        # Ctrl+Shift+P -> Pause.
-        shortcut_pause = QShortcut(QKeySequence("Ctrl+Shift+P"), self)
-        shortcut_pause.activated.connect(self.on_pause)
-
-        # Ctrl+S -> Stop.
-        shortcut_stop = QShortcut(QKeySequence("Ctrl+S"), self)
-        shortcut_stop.activated.connect(self.on_stop)
-
-        # Ctrl+Shift+A -> Set point A.
-        shortcut_set_a = QShortcut(QKeySequence("Ctrl+Shift+A"), self)
-        shortcut_set_a.activated.connect(self.on_set_point_a)
-
-        # Ctrl+Shift+B -> Set point B.
-        shortcut_set_b = QShortcut(QKeySequence("Ctrl+Shift+B"), self)
-        shortcut_set_b.activated.connect(self.on_set_point_b)
+        for keys, handler_name in _SHORTCUTS:
+            seq = _key_sequences.get(keys)
+            if seq is None:
+                seq = _key_sequences.setdefault(keys, QKeySequence(keys))
+            QShortcut(seq, self).activated.connect(getattr(self, handler_name))
 
     # ------------------------------------------------------------------ #
-    # Timer to update position and A–B loop logic
+    # Helper timers (seek coalescing, settings debounce)
     # ------------------------------------------------------------------ #
-    def _configure_timer(self) -> None:
-        """
-        Configure the periodic timer used to update the position slider
-        and apply A–B loop logic.
-        """
-        self.timer = QTimer(self)
-        self.timer.setInterval(100)  # milliseconds
-        self.timer.timeout.connect(self._update_position)
-        self.timer.start()
+    def _configure_timers(self) -> None:
+        """
+        Configure the helper timers for seek coalescing and settings
+        persistence.
+
+        Position/duration display updates need no timer: they are
+        driven by the player's signals.
+        """
+        # Coalescing timer for seeks: a slider drag emits many value
+        # changes per second, but each backend seek can force a decoder
+        # flush, so only the most recent pending value is applied and
+        # at most a few times per second.
+        self._pending_seek: Optional[int] = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(150)  # milliseconds
+        self._seek_timer.timeout.connect(self._flush_seek)
+
+        # Dirty-flag timer for settings persistence: the first change
+        # of a burst arms a single-shot timer, further changes ride it,
+        # and one flush per burst reaches the writer. Sustained churn
+        # (e.g. holding an arrow key on the volume slider) therefore
+        # writes at most once per second instead of pushing the write
+        # back forever.
+        self._settings_dirty = False
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(1000)  # milliseconds
+        self._settings_save_timer.timeout.connect(self._flush_settings)
 
     # ------------------------------------------------------------------ #
     # Slots / callbacks
@@ -293,45 +498,88 @@ class MainWindowQt(QMainWindow):
         """
         Open a file dialog to select an audio file.
 
-        If a file is selected:
-        - Load it into the :class:`AudioPlayer`.
-        - Update the file label.
-        - Load associated segments for that file.
-        - Save the folder path into settings.
+        The selected file (and its segments) are loaded on the worker
+        thread; :meth:`_on_load_finished` or :meth:`_on_load_failed`
+        completes the UI update once the result comes back.
         """
-        initial_dir = self.settings.get("last_opened_folder", str(Path.cwd()))
-
         filename, _ = QFileDialog.getOpenFileName(
             self,
             "Choose an audio file",
-            initial_dir,
-            "Audio files (*.mp3 *.wav *.wma *.flac *.ogg);;All files (*.*)",
+            self._last_folder,
+            self._FILE_FILTER,
+            # Skip per-directory icon resolution and write affordances:
+            # noticeably snappier on network home directories.
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons
+            | QFileDialog.Option.ReadOnly,
         )
 
         if not filename:
             return
 
         path = Path(filename)
+        self.lbl_status.setText(f"Loading {path.name}...")
+        self._load_requested.emit(path)
 
-        try:
-            self.audio_player.load_file(path)
-        except Exception as exc:
-            QMessageBox.critical(self, "Error", f"Could not load file: {exc}")
-            return
+    def _on_load_finished(self, path: Path, segments: SegmentManager) -> None:
+        """
+        Complete the UI update after a successful background load.
+
+        Parameters
+        ----------
+        path : Path
+            Audio file that was loaded.
+        segments : SegmentManager
+            Segments associated with the file.
+        """
+        # Path properties re-parse the underlying string on every
+        # access; compute the displayed name once.
+        name = path.name
 
         self.current_audio_path = path
-        self.lbl_file.setText(path.name)
-        self.lbl_status.setText(f"Loaded file: {path.name}")
+        self.lbl_file.setText(name)
+        self.lbl_status.setText(f"Loaded file: {name}")
 
         # Reset A/B points when a new file is loaded.
         self.on_clear_points(update_status=False)
 
-        # Load segments associated with this file (for future features).
-        self.segment_manager = load_segments(path)
+        # Segments associated with this file (for future features).
+        self.segment_manager = segments
+
+        # Refresh the display from the freshly parsed media; subsequent
+        # updates arrive through the player's signals.
+        self._on_duration_changed(self.audio_player.get_duration())
+        self._on_position_changed(0.0)
 
         # Remember this folder for future opens.
-        self.settings["last_opened_folder"] = str(path.parent)
-        save_settings(self.settings)
+        self._last_folder = str(path.parent)
+        self.settings["last_opened_folder"] = self._last_folder
+        self._mark_settings_dirty()
+
+    def _on_load_failed(self, path: Path, message: str) -> None:
+        """
+        Report a failed background load.
+
+        Parameters
+        ----------
+        path : Path
+            Audio file whose load failed.
+        message : str
+            Error message describing the failure.
+        """
+        self.lbl_status.setText(f"Could not load {path.name}.")
+
+        # Show the error without QMessageBox.critical's nested event
+        # loop: open() returns immediately, so queued signals (e.g.
+        # from the loader thread) keep flowing in order.
+        box = QMessageBox(
+            QMessageBox.Icon.Critical,
+            "Error",
+            f"Could not load file: {message}",
+            QMessageBox.StandardButton.Ok,
+            self,
+        )
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.open()
 
     def on_play(self) -> None:
         """
@@ -350,25 +598,40 @@ class MainWindowQt(QMainWindow):
     def on_stop(self) -> None:
         """
         Stop playback and update the status text.
+
+        The display rewinds through the ``positionChanged`` signal the
+        player emits while stopping.
         """
         self.audio_player.stop()
         self.lbl_status.setText("Stopped.")
 
-    def on_volume_change(self, value: int) -> None:
+    def _apply_volume(self, value: int) -> None:
         """
-        Callback triggered when the user moves the volume slider.
+        Apply a new volume to the audio player.
+
+        Connected to ``valueChanged``, so it runs on every tick of a
+        drag: it only touches the player and the in-memory settings.
 
         Parameters
         ----------
         value : int
-            Slider value (0–100).
+            Slider value (0–100), already an int per the
+            ``valueChanged(int)`` signature — no cast needed.
         """
-        volume = int(value)
-        self.audio_player.set_volume(volume)
+        self.audio_player.set_volume(value)
+        self.settings["default_volume"] = value
 
-        # Save this volume into settings.
-        self.settings["default_volume"] = volume
-        save_settings(self.settings)
+        # Mouse drags persist on sliderReleased; keyboard and wheel
+        # changes have no release event, so use the debounced save.
+        if not self.slider_volume.isSliderDown():
+            self._mark_settings_dirty()
+
+    def _persist_volume(self) -> None:
+        """
+        Persist the volume once the slider handle is released.
+        """
+        self.settings["default_volume"] = self.slider_volume.value()
+        self._flush_settings()
 
     def on_seek(self, value: int) -> None:
         """
@@ -381,19 +644,65 @@ class MainWindowQt(QMainWindow):
 
         Notes
         -----
-        Because this method is connected to ``valueChanged``, it is called
-        both when the user drags the slider with the mouse, and when they
-        use the left/right arrow keys while the slider has focus.
+        Connected to ``sliderMoved``, which :class:`SeekSlider` emits
+        both for mouse drags and for arrow/page keys while the slider
+        has focus — but never for programmatic updates.
+
+        The seek itself is coalesced: this only records the value and
+        (re)starts the seek timer, and :meth:`_flush_seek` applies the
+        latest one.
         """
-        seconds = float(value)
+        self._pending_seek = value
+        self._seek_timer.start()
+
+    def _flush_seek(self) -> None:
+        """
+        Apply the most recent pending seek, if any.
+        """
+        self._seek_timer.stop()
+
+        if self._pending_seek is None:
+            return
+
+        # Qt delivers slider values as ints; set_position takes any
+        # number of seconds, so no conversion is needed.
+        seconds = self._pending_seek
+        self._pending_seek = None
         self.audio_player.set_position(seconds)
 
+    def _mark_settings_dirty(self) -> None:
+        """
+        Flag the settings as modified and arm the flush timer.
+
+        Arming is idempotent: further changes during the interval ride
+        the same timer, so a burst results in a single flush.
+        """
+        self._settings_dirty = True
+        if not self._settings_save_timer.isActive():
+            self._settings_save_timer.start()
+
+    def _flush_settings(self) -> None:
+        """
+        Hand the current settings to the background writer, if dirty.
+
+        The actual disk write (and its fsync) happens on the writer
+        thread, never on the UI thread.
+        """
+        self._settings_save_timer.stop()
+
+        if not self._settings_dirty:
+            return
+
+        self._settings_dirty = False
+        save_settings_async(self.settings)
+
     def on_set_point_a(self) -> None:
         """
         Set point A at the current playback position.
         """
         current_pos = self.audio_player.get_position()
         self.point_a = current_pos
+        self._recompute_loop_active()
         self.lbl_status.setText(
             f"Point A set at {self._format_time(current_pos)}."
         )
@@ -404,6 +713,7 @@ class MainWindowQt(QMainWindow):
         """
         current_pos = self.audio_player.get_position()
         self.point_b = current_pos
+        self._recompute_loop_active()
         self.lbl_status.setText(
             f"Point B set at {self._format_time(current_pos)}."
         )
@@ -420,7 +730,14 @@ class MainWindowQt(QMainWindow):
         self.point_a = None
         self.point_b = None
         self.loop_enabled = False
+
+        # Uncheck without re-entering on_loop_state_changed — the loop
+        # state is already reset right above.
+        self.chk_loop.blockSignals(True)
         self.chk_loop.setChecked(False)
+        self.chk_loop.blockSignals(False)
+
+        self._recompute_loop_active()
 
         if update_status:
             self.lbl_status.setText("Points A and B cleared, loop disabled.")
@@ -434,47 +751,138 @@ class MainWindowQt(QMainWindow):
         state : int
             Qt check state (0 unchecked, 2 checked).
         """
-        self.loop_enabled = state != 0
+        enabled = state != 0
+        if enabled == self.loop_enabled:
+            # Nothing changed: skip the recompute.
+            return
+
+        self.loop_enabled = enabled
+        self._recompute_loop_active()
+
+    def _recompute_loop_active(self) -> None:
+        """
+        Refresh the cached A–B loop state.
+
+        Called whenever point A, point B or the loop checkbox change,
+        so the per-position check in :meth:`_on_position_changed`
+        stays a single boolean test.
+        """
+        self._loop_active = (
+            self.loop_enabled
+            and self.point_a is not None
+            and self.point_b is not None
+            and self.point_b > self.point_a
+        )
+        if self._loop_active:
+            self._loop_a = float(self.point_a)
+            self._loop_b = float(self.point_b)
 
     # ------------------------------------------------------------------ #
-    # Position update and A–B loop logic
+    # Player signal handlers and A–B loop logic
     # ------------------------------------------------------------------ #
-    def _update_position(self) -> None:
+    def _on_position_changed(self, current_pos: float) -> None:
         """
-        Update the position slider and time label, and apply A–B loop.
+        Update the position widgets and apply the A–B loop.
 
-        This method is called periodically by the internal timer.
+        Connected to :attr:`AudioPlayer.positionChanged`, so it runs at
+        the player's own update cadence instead of a polling timer.
+
+        Parameters
+        ----------
+        current_pos : float
+            New playback position in seconds.
         """
-        current_pos = self.audio_player.get_position()
-        duration = self.audio_player.get_duration()
+        # Skip the slider update when the displayed second is unchanged
+        # (programmatic setValue does not emit sliderMoved, so there is
+        # no feedback into on_seek either way).
+        pos_int = int(current_pos)
+        if pos_int != self._last_pos_int:
+            self.slider_position.setValue(pos_int)
+            self._last_pos_int = pos_int
+
+        self._update_time_label(current_pos)
 
-        # Update the slider range if duration is known.
-        if duration > 0:
-            self.slider_position.setRange(0, int(duration))
-        else:
+        # Apply A–B loop logic if enabled.
+        if self._loop_active and current_pos > self._loop_b:
+            # Jump back to point A; only restart playback if it
+            # actually stopped (calling play() on a running stream
+            # costs a backend state transition per loop).
+            audio_player = self.audio_player
+            audio_player.set_position(self._loop_a)
+            if not audio_player.is_playing():
+                audio_player.play()
+
+    def _on_duration_changed(self, duration: float) -> None:
+        """
+        Update the slider range and time label for a new duration.
+
+        Connected to :attr:`AudioPlayer.durationChanged`; typically
+        fires once per loaded file.
+
+        Parameters
+        ----------
+        duration : float
+            New media duration in seconds.
+        """
+        if duration < 0:
             duration = 0.0
+        self._duration = duration
+
+        # setRange is a widget reconfiguration and triggers a repaint,
+        # so only push actual changes.
+        duration_int = int(duration)
+        if duration_int > 0 and duration_int != self._last_duration_int:
+            self.slider_position.setRange(0, duration_int)
+            self._last_duration_int = duration_int
+
+        self._update_time_label(self.audio_player.get_position())
 
-        # Update slider value without triggering on_seek.
-        self.slider_position.blockSignals(True)
-        self.slider_position.setValue(int(current_pos))
-        self.slider_position.blockSignals(False)
+    def _update_time_label(self, current_pos: float) -> None:
+        """
+        Render the "mm:ss / mm:ss" label, skipping no-op updates.
 
-        # Update time label "mm:ss / mm:ss".
-        self.lbl_time.setText(
-            f"{self._format_time(current_pos)} / {self._format_time(duration)}"
+        Parameters
+        ----------
+        current_pos : float
+            Playback position in seconds to display.
+        """
+        time_text = (
+            f"{self._format_time(current_pos)} / {self._format_time(self._duration)}"
         )
+        if time_text != self._last_time_text:
+            self.lbl_time.setText(time_text)
+            self._last_time_text = time_text
 
-        # Apply A–B loop logic if enabled.
-        if (
-            self.loop_enabled
-            and self.point_a is not None
-            and self.point_b is not None
-            and self.point_b > self.point_a
-        ):
-            if current_pos > self.point_b:
-                # Jump back to point A and continue playback.
-                self.audio_player.set_position(self.point_a)
-                self.audio_player.play()
+    # ------------------------------------------------------------------ #
+    # Window lifecycle
+    # ------------------------------------------------------------------ #
+    def closeEvent(self, event) -> None:
+        """
+        Flush pending work before the window closes.
+
+        Parameters
+        ----------
+        event : QCloseEvent
+            Close event forwarded by Qt.
+        """
+        # Stop the helper timers first so no callback fires against a
+        # window that is tearing down.
+        self._seek_timer.stop()
+
+        # Make sure debounced saves are not lost on exit.
+        self.segment_autosaver.flush()
+        if self._settings_save_timer.isActive():
+            self._flush_settings()
+
+        # Give the background settings writer a chance to drain before
+        # the process (and its daemon threads) goes away.
+        flush_pending_saves()
+
+        # Shut the loader thread down cleanly.
+        self._load_thread.quit()
+        self._load_thread.wait(2000)
+
+        super().closeEvent(event)
 
     # ------------------------------------------------------------------ #
     # Helpers
@@ -496,7 +904,4 @@ class MainWindowQt(QMainWindow):
         """
         if seconds < 0:
             seconds = 0.0
-        total_seconds = int(seconds)
-        minutes = total_seconds // 60
-        secs = total_seconds % 60
-        return f"{minutes:02d}:{secs:02d}"
+        return _format_time_impl(int(seconds))